@@ -1,5 +1,101 @@
 import numpy as np
 import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+def _price_components(coupon_pay, par_val, req_yield_per, bond_len):
+    """ Compute Present Values of Coupon Stream and Par Across a Yield Vector
+
+    Evaluates the discount factor once per yield and derives both price components
+    from it. Compiled with a parallel range when numba is available so a vector of
+    yields is priced across threads in a single fused pass.
+
+    Args:
+        coupon_pay (float): Coupon payment per period.
+        par_val (float): Value returned at maturity (par or call value).
+        req_yield_per (np.array): Per-period yields as decimals.
+        bond_len (float): Number of periods until maturity.
+
+    Returns:
+        np.array: The 1st return value. Present value of the coupon payments per yield.
+        np.array: The 2nd return value. Present value of the par value per yield.
+
+    """
+    m = req_yield_per.shape[0]
+    coupon_price = np.empty(m)
+    par_price = np.empty(m)
+    for i in prange(m):
+        v = (1.0 + req_yield_per[i]) ** -bond_len
+        coupon_price[i] = coupon_pay * (1.0 - v) / req_yield_per[i]
+        par_price[i] = par_val * v
+    return coupon_price, par_price
+
+if numba is not None:
+    _price_components = numba.njit(parallel=True, cache=True, fastmath=True)(_price_components)
+
+class BondBook:
+    """ Structure-of-Arrays Container for a Portfolio of Bonds
+
+    Holds one contiguous float64 array per bond field so a whole portfolio can be
+    priced through a single vectorized bond_price_calc call instead of a Python
+    loop of per-bond calls.
+
+    Args:
+        lens (array): Number of bond periods before maturity, per bond.
+        coupons (array): Current interest rate return per specified period, per bond.
+        pars (array): Value of bond at par, per bond.
+        yields (array): Expected yearly return, per bond.
+
+    """
+
+    def __init__(self, lens, coupons, pars, yields):
+        self.lens = lens
+        self.coupons = coupons
+        self.pars = pars
+        self.yields = yields
+
+    @property
+    def lens(self):
+        return self._lens
+
+    @lens.setter
+    def lens(self, value):
+        self._lens = np.ascontiguousarray(value, dtype=np.float64)
+
+    @property
+    def coupons(self):
+        return self._coupons
+
+    @coupons.setter
+    def coupons(self, value):
+        self._coupons = np.ascontiguousarray(value, dtype=np.float64)
+
+    @property
+    def pars(self):
+        return self._pars
+
+    @pars.setter
+    def pars(self, value):
+        self._pars = np.ascontiguousarray(value, dtype=np.float64)
+
+    @property
+    def yields(self):
+        return self._yields
+
+    @yields.setter
+    def yields(self, value):
+        self._yields = np.ascontiguousarray(value, dtype=np.float64)
 
 def bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', details=True):
     """ Calculate Cash-flows for a Bond
@@ -21,11 +117,11 @@ def bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', detail
         
     """
     
-    # convert to numpy arrays
-    bond_len = np.array(bond_len)
-    coupon_per = np.array(coupon_per)
-    par_val = np.array(par_val)
-    
+    # convert to numpy arrays without copying ndarray inputs
+    bond_len = np.asarray(bond_len, dtype=np.float64)
+    coupon_per = np.asarray(coupon_per, dtype=np.float64)
+    par_val = np.asarray(par_val, dtype=np.float64)
+
     # fail safe
     if (bond_len.size != coupon_per.size) | (coupon_per.size != par_val.size):
         return 'Incorrect argument dimensions'
@@ -33,13 +129,13 @@ def bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', detail
         return 'Incorrect period length description'
 
     # adjust fields based on length of bond period
-    period = np.where(len_time.lower()=='semiannual', 2, 1)
-    bond_len = np.multiply(bond_len, period)
-    coupon_per = np.divide(coupon_per, period)
-    
-    # adjust for given coupon rate format
-    coupon_per = np.where(coupon_per > 1, np.divide(coupon_per, 100), coupon_per)
-    
+    period = 2 if len_time.lower()=='semiannual' else 1
+    bond_len = bond_len * period
+    coupon_per = np.asarray(coupon_per / period, dtype=np.float64)
+
+    # adjust for given coupon rate format in place
+    np.divide(coupon_per, 100.0, where=coupon_per > 1, out=coupon_per)
+
     # calculate cash-flow
     coupon_per = np.multiply(par_val, coupon_per)
     
@@ -48,20 +144,21 @@ def bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', detail
             print(len_time.capitalize() + ' Coupon Rate - ${:.2f} for {} periods'.format(coupon_per, bond_len))
             print('Maturity Value - ${:.2f}'.format(par_val))
         else:
-            np.set_printoptions(precision=2)
-            print(len_time.capitalize() + ' Coupon Rate - ${} for {} periods'.format(coupon_per, bond_len))
-            print('Maturity Value - ${}'.format(par_val))
+            with np.printoptions(precision=2):
+                print(len_time.capitalize() + ' Coupon Rate - ${} for {} periods'.format(coupon_per, bond_len))
+                print('Maturity Value - ${}'.format(par_val))
         
     return coupon_per, par_val, bond_len
 
-def bond_price_calc(bond_len, coupon_per, par_val, req_yield_per, call_val=0, len_time='annual', details=True):
+def bond_price_calc(bond_len, coupon_per=None, par_val=None, req_yield_per=None, call_val=0, len_time='annual', details=True):
     """ Calculate Pricing for a Bond
-    
-    Given args are converted into numpy arrrays. 
+
+    Given args are converted into numpy arrrays.
     They are then used to calculate what the payout is for a bond during its life into maturity.
-    
+    A BondBook may be passed as the first argument to price a whole portfolio at once.
+
     Args:
-        bond_len (int): Number of bond periods before maturity.
+        bond_len (int or BondBook): Number of bond periods before maturity, or a portfolio.
         coupon_per (float): Current interest rate return on a bond per specified period.
         par_val (float): Value of bona at par.
         req_yield_per (float): Expected yearly return on bond.
@@ -75,11 +172,16 @@ def bond_price_calc(bond_len, coupon_per, par_val, req_yield_per, call_val=0, le
         np.float: The 3rd return value. The current price of the bond.
         
     """
-    # convert to numpy arrays
-    bond_len = np.array(bond_len)
-    coupon_per = np.array(coupon_per)
-    par_val = np.array(par_val)
-    req_yield_per = np.array(req_yield_per)
+    # unpack a portfolio into its field arrays
+    if isinstance(bond_len, BondBook):
+        book = bond_len
+        bond_len, coupon_per, par_val, req_yield_per = book.lens, book.coupons, book.pars, book.yields
+
+    # convert to numpy arrays without copying ndarray inputs
+    bond_len = np.asarray(bond_len, dtype=np.float64)
+    coupon_per = np.asarray(coupon_per, dtype=np.float64)
+    par_val = np.asarray(par_val, dtype=np.float64)
+    req_yield_per = np.asarray(req_yield_per, dtype=np.float64)
     
     # fail safe
     if (bond_len.size != coupon_per.size) | (coupon_per.size != par_val.size):
@@ -88,25 +190,42 @@ def bond_price_calc(bond_len, coupon_per, par_val, req_yield_per, call_val=0, le
         return 'Incorrect period length description'
     
     # adjust fields based on length of bond period
-    p1 = np.where(len_time.lower()=='semiannual', np.divide(12.0, 6.0), 0.0)
-    p2 = np.where(len_time.lower()=='annual', np.divide(12.0, 12.0), 0.0)
-    period = np.add(p1, p2)
-    bond_len = np.multiply(bond_len, period)
-    coupon_per = np.divide(coupon_per, period)
-    req_yield_per = np.divide(req_yield_per, period)
-    
-    # adjust for given coupon rate format
-    coupon_per = np.where(coupon_per > 1, np.divide(coupon_per, 100), coupon_per)
-    req_yield_per = np.where(req_yield_per > 1, np.divide(req_yield_per, 100), req_yield_per)
-    
+    period = 2.0 if len_time.lower()=='semiannual' else 1.0
+    bond_len = bond_len * period
+    coupon_per = np.asarray(coupon_per / period, dtype=np.float64)
+    req_yield_per = np.asarray(req_yield_per / period, dtype=np.float64)
+
+    # adjust for given coupon rate format in place
+    np.divide(coupon_per, 100.0, where=coupon_per > 1, out=coupon_per)
+    np.divide(req_yield_per, 100.0, where=req_yield_per > 1, out=req_yield_per)
+
     # calculate cash-flow
     coupon_pay, par_val = bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', details=details)[0:2]
     par_val = np.where(call_val>0, call_val, par_val)
     
-    # calculate price
-    coupon_pay_price = np.round(np.multiply(coupon_pay, np.divide(np.subtract(1, np.divide(1, np.power(np.add(1, req_yield_per), bond_len))), req_yield_per)), decimals=2)
-    par_val_price = np.round(np.multiply(par_val, np.divide(1, np.power(np.add(1, req_yield_per), bond_len))), decimals=2)
-    bond_price = np.round(np.add(coupon_pay_price, par_val_price), decimals=2)
+    # calculate price, reusing a single discount factor; the numba kernel and
+    # numexpr both fuse the batched formula into one multithreaded pass
+    # instead of ~6 intermediates
+    if (numba is not None) and (req_yield_per.ndim == 1) and (np.ndim(coupon_pay) == 0) and (np.ndim(par_val) == 0) and (np.ndim(bond_len) == 0):
+        coupon_prices, par_prices = _price_components(float(coupon_pay), float(par_val), req_yield_per, float(bond_len))
+        coupon_pay_price = np.round(coupon_prices, decimals=2)
+        par_val_price = np.round(par_prices, decimals=2)
+    elif (numexpr is not None) and (req_yield_per.size > 1):
+        local_dict = {'coupon_pay': coupon_pay, 'par': par_val, 'y': req_yield_per, 'n': bond_len}
+        disc = numexpr.evaluate('(1.0 + y)**-n', local_dict=local_dict)
+        local_dict['disc'] = disc
+        coupon_pay_price = np.round(numexpr.evaluate('coupon_pay * (1.0 - disc) / y', local_dict=local_dict), decimals=2)
+        par_val_price = np.round(numexpr.evaluate('par * disc', local_dict=local_dict), decimals=2)
+    else:
+        if req_yield_per.size > 1:
+            # exp/log1p run in NumPy's SIMD loops; np.power falls back to scalar pow
+            disc = np.exp(-bond_len * np.log1p(req_yield_per))
+        else:
+            disc = 1.0 / np.power(1.0 + req_yield_per, bond_len)
+        annuity = (1.0 - disc) / req_yield_per
+        coupon_pay_price = np.round(coupon_pay * annuity, decimals=2)
+        par_val_price = np.round(par_val * disc, decimals=2)
+    bond_price = np.round(coupon_pay_price + par_val_price, decimals=2)
     
     if details:
         if (bond_len.size == 1) & (req_yield_per.size == 1):
@@ -114,10 +233,10 @@ def bond_price_calc(bond_len, coupon_per, par_val, req_yield_per, call_val=0, le
             print('Present Value of Par/Maturity Value - ${:.2f}'.format(par_val_price))
             print('Present Value of Bond - ${:.2f}'.format(bond_price))
         else:
-            np.set_printoptions(precision=2)
-            print('Present Value of Coupon Payment - ${}'.format(coupon_pay_price))
-            print('Present Value of Par/Maturity Value - ${}'.format(par_val_price))
-            print('Present Value of Bond - ${}'.format(bond_price))
+            with np.printoptions(precision=2):
+                print('Present Value of Coupon Payment - ${}'.format(coupon_pay_price))
+                print('Present Value of Par/Maturity Value - ${}'.format(par_val_price))
+                print('Present Value of Bond - ${}'.format(bond_price))
         
     return coupon_pay_price, par_val_price, bond_price
 
@@ -133,15 +252,20 @@ def actual_time_ratio_calc(nd1, sd2, period):
         nd1 (date): Date of next payout for a bond.
         sd2 (date): Date of settlement for a bond, or official purchase date.
         period (int): number of bond payouts until maturity.
-        
+
     Returns:
-        np.float: The time ratio for number of days between maturity and settlement dates and total number of days in a year.
-        np.float: The time ratio for number of days between settlement date and next coupon date and total number of days in a year.
-        
+        float: The time ratio for number of days between maturity and settlement dates and total number of days in a year.
+        float: The time ratio for number of days between settlement date and next coupon date and total number of days in a year.
+
     """
-    numer = (nd1 - sd2) / np.timedelta64(1, 'D')
-    denom = (nd1 - np.datetime64(np.datetime64(nd1, 'M') - np.timedelta64(6, 'M'), 'D')) / np.timedelta64(1, 'D')
-    return np.divide(numer, denom), np.divide(np.subtract(denom, numer), denom)
+    # convert once to datetime.date; scalar date arithmetic beats datetime64 ufuncs
+    if isinstance(nd1, np.datetime64):
+        nd1 = nd1.astype('datetime64[D]').item()
+    if isinstance(sd2, np.datetime64):
+        sd2 = sd2.astype('datetime64[D]').item()
+    numer = (nd1 - sd2).days
+    denom = (nd1 - (nd1.replace(day=1) - relativedelta(months=6))).days
+    return numer / denom, (denom - numer) / denom
 
 def thirtysixty_time_ratio_calc(sd1, dr2, td3, period):
     """ Calculate Ratio of Days Between Two Dates to Days in a Year
@@ -156,17 +280,22 @@ def thirtysixty_time_ratio_calc(sd1, dr2, td3, period):
         dr2 (int): Number of days remaining to next bond payout.
         td3 (int): Number of days from maturity to settlement date.
         period (int): number of bond payouts until maturity.
-        
+
     Returns:
-        np.float: The time ratio for number of days between maturity and settlement dates and total number of days in a year.
-        np.float: The time ratio for number of days between settlement date and next coupon date and total number of days in a year.
-        
-    """    
-    days_passed = (sd1 - (np.datetime64(sd1, 'M') - np.timedelta64(1, 'D'))) / np.timedelta64(1, 'D')
-    days_remaining = np.where(np.add(dr2, days_passed) > 30, np.subtract(30, days_passed), dr2)
-    numer = np.add(np.add(np.multiply(np.subtract(td3, 1), 30), days_remaining), 1)
-    denom = np.multiply(30, period)
-    return np.divide(numer, denom), np.divide(np.subtract(denom, numer), denom)
+        float: The time ratio for number of days between maturity and settlement dates and total number of days in a year.
+        float: The time ratio for number of days between settlement date and next coupon date and total number of days in a year.
+
+    """
+    # convert once to scalars; scalar date arithmetic beats datetime64 ufuncs
+    if isinstance(sd1, np.datetime64):
+        sd1 = sd1.astype('datetime64[D]').item()
+    dr2 = float(dr2)
+    td3 = float(td3)
+    days_passed = sd1.day
+    days_remaining = 30 - days_passed if dr2 + days_passed > 30 else dr2
+    numer = (td3 - 1) * 30 + days_remaining + 1
+    denom = 30 * period
+    return numer / denom, (denom - numer) / denom
     
 def next_pay_date_calc(sd1, md2, period):
     """ Calculate the Date of the Next Payout Period
@@ -216,21 +345,14 @@ def time_ratio_calc(mat_date, sett_date, period, date_calc='3060', len_time='sem
         return 'Incorrect description for timing calculation'   
     
     # calculate next pay date for coupon
-    next_pay_date, days_remaining, time_diff = next_pay_date_calc(sett_date, mat_date, np.divide(12.0, period))
-    
+    next_pay_date, days_remaining, time_diff = next_pay_date_calc(sett_date, mat_date, 12.0 / period)
+
     # find time ratio based on specified time counting calculation
-    time_ratio_3060 = np.where(date_calc=='3060', thirtysixty_time_ratio_calc(sett_date, days_remaining, time_diff, np.divide(12.0, period))[0], 0.0)
-    ai_ratio_3060 = np.where(date_calc=='3060', thirtysixty_time_ratio_calc(sett_date, days_remaining, time_diff, np.divide(12.0, period))[1], 0.0)
-    
-    time_ratio_actual = np.where(date_calc=='actual', actual_time_ratio_calc(next_pay_date, sett_date, np.divide(12.0, period))[0], 0.0)
-    ai_ratio_actual = np.where(date_calc=='actual', actual_time_ratio_calc(next_pay_date, sett_date, np.divide(12.0, period))[1], 0.0)
-    
-    time_ratio = np.add(time_ratio_3060, time_ratio_actual)
-    ai_ratio = np.add(ai_ratio_3060, ai_ratio_actual)
+    if date_calc.lower() == '3060':
+        time_ratio, ai_ratio = thirtysixty_time_ratio_calc(sett_date, days_remaining, time_diff, 12.0 / period)
+    else:
+        time_ratio, ai_ratio = actual_time_ratio_calc(next_pay_date, sett_date, 12.0 / period)
 
-    # caclulate the bond price
-    np.zeros(12)
-    
     # secondary fail safe
     if time_ratio == 0.0:
         return 'Incorrect timing calculated'
@@ -257,10 +379,10 @@ def bond_price_calc_sett(bond_len, coupon_per, par_val, req_yield_per, price='cl
         np.float: The price of the coupon payment.
         
     """
-    # convert to numpy arrays
-    coupon_per = np.array(coupon_per)
-    par_val = np.array(par_val)
-    req_yield_per = np.array(req_yield_per)
+    # convert to numpy arrays without copying ndarray inputs
+    coupon_per = np.asarray(coupon_per, dtype=np.float64)
+    par_val = np.asarray(par_val, dtype=np.float64)
+    req_yield_per = np.asarray(req_yield_per, dtype=np.float64)
     mat_date = np.datetime64(bond_len[0])
     sett_date = np.datetime64(bond_len[1])    
     
@@ -271,39 +393,49 @@ def bond_price_calc_sett(bond_len, coupon_per, par_val, req_yield_per, price='cl
         return('Incorrect price description') 
     
     # adjust fields based on length of bond period
-    p1 = np.where(len_time.lower()=='semiannual', np.divide(12.0, 6.0), 0.0)
-    p2 = np.where(len_time.lower()=='annual', np.divide(12.0, 12.0), 0.0)
-    period = np.add(p1, p2)   
-    bond_len = np.ceil(np.divide((mat_date - sett_date).astype('timedelta64[M]') / np.timedelta64(1, 'M'), np.divide(12.0, period)))
-    coupon_per = np.divide(coupon_per, period)
-    req_yield_per = np.divide(req_yield_per, period)
-    
-    # adjust for given coupon rate format
-    coupon_per = np.where(coupon_per > 1, np.divide(coupon_per, 100), coupon_per)
-    req_yield_per = np.where(req_yield_per > 1, np.divide(req_yield_per, 100), req_yield_per)
+    period = 2.0 if len_time.lower()=='semiannual' else 1.0
+    bond_len = np.ceil(np.divide((mat_date - sett_date).astype('timedelta64[M]') / np.timedelta64(1, 'M'), 12.0 / period))
+    coupon_per = np.asarray(coupon_per / period, dtype=np.float64)
+    req_yield_per = np.asarray(req_yield_per / period, dtype=np.float64)
+
+    # adjust for given coupon rate format in place
+    np.divide(coupon_per, 100.0, where=coupon_per > 1, out=coupon_per)
+    np.divide(req_yield_per, 100.0, where=req_yield_per > 1, out=req_yield_per)
     
     # calculate time ratio and accrued interest ratio
-    time_ratio = time_ratio_calc(mat_date=mat_date, sett_date=sett_date, period=period, date_calc=date_calc, len_time=len_time)[0]
-    ai_ratio = time_ratio_calc(mat_date=mat_date, sett_date=sett_date, period=period, date_calc=date_calc, len_time=len_time)[1]
-    if isinstance(time_ratio, str):
-        return time_ratio
+    ratios = time_ratio_calc(mat_date=mat_date, sett_date=sett_date, period=period, date_calc=date_calc, len_time=len_time)
+    if isinstance(ratios, str):
+        return ratios
+    time_ratio, ai_ratio = ratios
     
     # calculate cash-flow
     coupon_pay = bond_cash_flow_calc(bond_len, coupon_per, par_val, len_time='annual', details=details)[0]
     
     # calculate price
     bond_len = np.where(time_ratio.is_integer(), np.add(bond_len, 1), bond_len)
-    periods = np.add(np.arange(bond_len.astype(int)), time_ratio)
-    coupon_pay = np.full(bond_len.astype(int), coupon_pay)
-    ai_price = np.multiply(coupon_pay[0], ai_ratio)
-    coupon_pay[-1] = np.add(coupon_pay[-1], par_val)
-    bond_price = np.divide(coupon_pay, np.power(np.add(1, req_yield_per), periods))
-    bond_price[0] = np.where(price.lower() == 'clean', bond_price[0] - ai_price, bond_price[0])
-    
+    n = int(bond_len)
+    ai_price = float(coupon_pay) * ai_ratio
+
+    # build the discount vector by cumulative product instead of per-element pow
+    inv = np.divide(1.0, np.add(1.0, req_yield_per))
+    disc = np.empty(n)
+    disc[0] = np.power(inv, time_ratio)
+    disc[1:] = inv
+    np.cumprod(disc, out=disc)
+
+    # keep the coupon as a scalar and fold par into the final period directly
+    bond_price = coupon_pay * disc
+    bond_price[-1] += par_val * disc[-1]
+    if price.lower() == 'clean':
+        bond_price[0] -= ai_price
+
     if details:
         print('Accrued Interest - ${:.2f}'.format(ai_price))
         if (bond_len.size == 1) & (req_yield_per.size == 1):
-            comb_array = np.array([periods, coupon_pay, bond_price])
+            periods = np.add(np.arange(n), time_ratio)
+            coupon_sched = np.full(n, coupon_pay, dtype=np.float64)
+            coupon_sched[-1] += par_val
+            comb_array = np.array([periods, coupon_sched, bond_price])
             comb_data = pd.DataFrame(data=comb_array.T, columns=['Period', 'Coupon Payment Scheduled', 'Bond Price'])
             print(comb_data)
             if price.lower() == 'clean':
@@ -311,6 +443,6 @@ def bond_price_calc_sett(bond_len, coupon_per, par_val, req_yield_per, price='cl
             if price.lower() == 'dirty':
                 print('Present Dirty Value of Bond - ${:.2f}'.format(np.sum(bond_price)))
         else:
-            np.set_printoptions(precision=2)
-            print('Present Value of Bond - ${}'.format(bond_price))
+            with np.printoptions(precision=2):
+                print('Present Value of Bond - ${}'.format(bond_price))
     return np.sum(bond_price)
\ No newline at end of file
@@ -1,7 +1,17 @@
+import functools
+import math
+
 import numpy as np
 import pandas as pd
 import pricing as price
 
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
 def bond_current_yield_calc(bond_len, coupon_per, bond_price, par_val, len_time='annual', details=True):
     """ Calculate Current Yield for a Bond
     
@@ -20,11 +30,11 @@ def bond_current_yield_calc(bond_len, coupon_per, bond_price, par_val, len_time=
         np.float: Required yield based on current yield percentage.
         
     """
-    # convert to numpy arrays
-    bond_len = np.array(bond_len)
-    coupon_per = np.array(coupon_per)
-    bond_price = np.array(bond_price)
-    par_val = np.array(par_val)
+    # convert to numpy arrays without copying ndarray inputs
+    bond_len = np.asarray(bond_len, dtype=np.float64)
+    coupon_per = np.asarray(coupon_per, dtype=np.float64)
+    bond_price = np.asarray(bond_price, dtype=np.float64)
+    par_val = np.asarray(par_val, dtype=np.float64)
     
     # fail safe
     if (bond_len.size != coupon_per.size) | (coupon_per.size != par_val.size):
@@ -33,17 +43,11 @@ def bond_current_yield_calc(bond_len, coupon_per, bond_price, par_val, len_time=
         return 'Incorrect period length description'
     
     # adjust fields based on length of bond period
-<<<<<<< Updated upstream
-    period = np.where(len_time.lower()=='semiannual', 2, 1)
-=======
-    p1 = np.where(len_time.lower()=='semiannual', np.divide(12.0, 6.0), 0.0)
-    p2 = np.where(len_time.lower()=='annual', np.divide(12.0, 12.0), 0.0)
-    period = np.add(p1, p2)
->>>>>>> Stashed changes
-    coupon_per = np.multiply(coupon_per, period)
-    
-    # adjust for given coupon rate format
-    coupon_per = np.where(coupon_per > 1, np.divide(coupon_per, 100), coupon_per)
+    period = 2 if len_time.lower()=='semiannual' else 1
+    coupon_per = np.asarray(coupon_per * period, dtype=np.float64)
+
+    # adjust for given coupon rate format in place
+    np.divide(coupon_per, 100.0, where=coupon_per > 1, out=coupon_per)
     
     # calculate current yield
     coupon_per = np.multiply(par_val, coupon_per)
@@ -55,12 +59,104 @@ def bond_current_yield_calc(bond_len, coupon_per, bond_price, par_val, len_time=
             print(len_time.capitalize() + ' Coupon Rate - ${:.2f}'.format(coupon_per))
             print('Required Yield - {:.2%}'.format(req_yield_per))
         else:
-            np.set_printoptions(precision=2)
-            print(len_time.capitalize() + ' Coupon Rate - ${}'.format(coupon_per))
-            print('Required Yield - {}'.format(req_yield_per))
+            with np.printoptions(precision=2):
+                print(len_time.capitalize() + ' Coupon Rate - ${}'.format(coupon_per))
+                print('Required Yield - {}'.format(req_yield_per))
         
     return req_yield_per
 
+def _ytm_newton(coupon_pay, par_val, n, price, y0=0.05):
+    """ Solve Yield-to-Maturity with Newton-Raphson Iteration
+
+    Finds the per-period yield y such that the present value of the bond cash-flows
+    equals the given price, using the closed-form annuity value and its derivative.
+    Converges in a handful of iterations instead of sweeping a grid of candidate yields.
+
+    Args:
+        coupon_pay (float): Coupon payment per period.
+        par_val (float): Value returned at maturity (par or call value).
+        n (int): Number of periods until maturity.
+        price (float): Price of bond given.
+        y0 (float): Starting guess for the per-period yield.
+
+    Returns:
+        float: The per-period yield, or nan if the iteration failed to converge.
+
+    """
+    y = y0
+    for _ in range(20):
+        if y <= 0.0:
+            return np.nan
+        v = math.pow(1.0 + y, -n)
+        pv = coupon_pay * (1.0 - v) / y + par_val * v
+        if abs(pv - price) < 1e-8:
+            return y
+        dpv = -coupon_pay / y * ((1.0 - v) / y - n * v / (1.0 + y)) - n * par_val * v / (1.0 + y)
+        # damp the update so an overshoot below zero halves y instead of bailing
+        y = max(y - (pv - price) / dpv, 0.5 * y)
+    return np.nan
+
+# compile the hot scalar loop at import when numba is available
+if numba is not None:
+    _ytm_newton = numba.njit('float64(float64, float64, int64, float64, float64)', cache=True, fastmath=True)(_ytm_newton)
+
+def _ytm_newton_batch(coupon_pay, par_val, n, prices, y0):
+    """ Solve Yield-to-Maturity for a Vector of Observed Prices
+
+    Runs the Newton-Raphson solver once per observed price for the same bond terms.
+    Compiled with a parallel range when numba is available so a portfolio of prices
+    is solved across threads.
+
+    Args:
+        coupon_pay (float): Coupon payment per period.
+        par_val (float): Value returned at maturity (par or call value).
+        n (int): Number of periods until maturity.
+        prices (np.array): Observed bond prices.
+        y0 (float): Starting guess for the per-period yield.
+
+    Returns:
+        np.array: The per-period yield for each price, nan where not converged.
+
+    """
+    out = np.empty(prices.shape[0])
+    for i in prange(prices.shape[0]):
+        out[i] = _ytm_newton(coupon_pay, par_val, n, prices[i], y0)
+    return out
+
+if numba is not None:
+    _ytm_newton_batch = numba.njit(parallel=True, cache=True, fastmath=True)(_ytm_newton_batch)
+
+@functools.lru_cache(maxsize=1024)
+def _yield_sweep(bond_len, coupon_per, par_val, call_val, len_time):
+    """ Price a Bond Across the Full Grid of Candidate Yields
+
+    The sweep depends only on the bond terms, not on the observed price, so repeat
+    lookups for the same bond reuse the cached grid instead of re-pricing it. The
+    grid covers just above the period count through 100 so every entry prices
+    under the percent convention; over that single regime price is monotonically
+    decreasing in yield, so the grid is cached in ascending price order as
+    contiguous arrays ready for np.searchsorted.
+
+    Args:
+        bond_len (float): Number of bond periods before maturity.
+        coupon_per (float): Current interest rate return on a bond per specified period.
+        par_val (float): Value of bond at par.
+        call_val (float): Value of bond at first callable event.
+        len_time (str): Period length designation.
+
+    Returns:
+        np.array: The 1st return value. Candidate yields in percent, descending.
+        np.array: The 2nd return value. Bond price at each candidate yield, ascending.
+
+    """
+    # start above the period count so every grid entry stays > 1 after the
+    # per-period division in bond_price_calc, whose rate normalization reads
+    # values <= 1 as decimals rather than percents
+    period = 2 if len_time.lower() == 'semiannual' else 1
+    req_yield_pers = np.arange(period + .01, 100, .01)
+    bond_prices = price.bond_price_calc(bond_len=bond_len, coupon_per=coupon_per, par_val=par_val, call_val=call_val, req_yield_per=req_yield_pers, len_time=len_time, details=False)[2]
+    return np.ascontiguousarray(req_yield_pers[::-1]), np.ascontiguousarray(bond_prices[::-1])
+
 def bond_yield_maturity_calc(bond_len, coupon_per, bond_price, par_val, call_val=0, len_time='annual', details=True):    
     """ Calculate Yield-to-Maturity for a Bond
     
@@ -70,7 +166,7 @@ def bond_yield_maturity_calc(bond_len, coupon_per, bond_price, par_val, call_val
     Args:
         bond_len (int): Number of bond periods before maturity.
         coupon_per (float): Current interest rate return on a bond per specified period.
-        bond_price (float): Price of bond given.        
+        bond_price (float or np.array): Price of bond given, or array of observed prices.
         par_val (float): Value of bond at par.
         call_val (float): Value of bond at first callable event.
         len_time (str): Period length designation.
@@ -79,22 +175,46 @@ def bond_yield_maturity_calc(bond_len, coupon_per, bond_price, par_val, call_val
     Returns:
         np.float: Required interest optimized for given bond value.
         
-    """    
-    # calculate pricing
-    req_yield_pers = np.arange(.01, 100, .01)
-    bond_prices = price.bond_price_calc(bond_len=bond_len, coupon_per=coupon_per, par_val=par_val, call_val=call_val, req_yield_per=req_yield_pers, len_time=len_time, details=False)[2]
-    
-    # calculate yield
-    try:
-        bond_index = np.where(np.round(bond_prices, 2) == np.round(bond_price, 2))[0]
-        bond_index.shape[1]
-    except:
-        ordered_bond_prices = bond_prices.copy()
-        ordered_bond_prices.sort() 
-        bond_index = np.searchsorted(np.round(ordered_bond_prices, 2), np.array(np.round(bond_price, 2)))
-        bond_index = np.where(bond_prices == ordered_bond_prices[bond_index])
-     
+    """
+    # adjust fields based on length of bond period
+    period = 2 if len_time.lower()=='semiannual' else 1
+    coupon_rate = np.asarray(coupon_per / period, dtype=np.float64)
+    np.divide(coupon_rate, 100.0, where=coupon_rate > 1, out=coupon_rate)
+
+    # calculate cash-flow
+    coupon_pay = np.multiply(par_val, coupon_rate)
+    mat_val = call_val if call_val > 0 else par_val
+
+    # solve for yield analytically; a vector of observed prices solves elementwise
+    bond_price = np.asarray(bond_price, dtype=np.float64)
+    n = int(bond_len * period)
+    if bond_price.ndim == 0:
+        req_yield = _ytm_newton(float(coupon_pay), float(mat_val), n, float(bond_price), 0.05)
+    else:
+        req_yield = _ytm_newton_batch(float(coupon_pay), float(mat_val), n, bond_price, 0.05)
+    req_yield = req_yield * period * 100
+
+    # fall back to a grid search for any price the solver failed to converge on
+    if np.any(np.isnan(req_yield)):
+        yields_desc, prices_asc = _yield_sweep(float(bond_len), float(coupon_per), float(par_val), float(call_val), len_time.lower())
+
+        # interpolate between the two grid points bracketing the observed price
+        bond_index = np.searchsorted(prices_asc, bond_price)
+        bond_index = np.clip(bond_index, 1, prices_asc.size - 1)
+        p_lo, p_hi = prices_asc[bond_index - 1], prices_asc[bond_index]
+        y_lo, y_hi = yields_desc[bond_index - 1], yields_desc[bond_index]
+        grid_yield = y_lo + (y_hi - y_lo) * (bond_price - p_lo) / (p_hi - p_lo)
+        # clamp to the grid range rather than extrapolating past its ends
+        grid_yield = np.clip(grid_yield, yields_desc[-1], yields_desc[0])
+        req_yield = np.where(np.isnan(req_yield), grid_yield, req_yield)
+        if req_yield.ndim == 0:
+            req_yield = np.float64(req_yield)
+
     if details:
-            print('Yield-to-Maturity Lookup - {:.2%}'.format(np.divide(req_yield_pers[bond_index][0], 100)))
+        if bond_price.ndim == 0:
+            print('Yield-to-Maturity Lookup - {:.2%}'.format(np.divide(req_yield, 100)))
+        else:
+            with np.printoptions(precision=2):
+                print('Yield-to-Maturity Lookup - {}'.format(np.divide(req_yield, 100)))
 
-    return req_yield_pers[bond_index][0]
\ No newline at end of file
+    return req_yield
\ No newline at end of file